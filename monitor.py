@@ -5,16 +5,15 @@ Tracks packages and sends Google Chat notifications only when changes are detect
 Designed to run via GitHub Actions or cron jobs
 """
 
-from tracker import AnjaniTracker
 import json
 import os
 import sys
 from datetime import datetime
 
 
-def get_tracking_ids(state_file='tracking_state.json'):
+def get_tracking_ids(state, state_file='tracking_state.json'):
     """
-    Get tracking IDs from state file
+    Get tracking IDs from the loaded state
 
     The state file contains all tracking IDs as top-level keys.
     To add a new tracking ID, add it to the state file with an empty object:
@@ -22,20 +21,12 @@ def get_tracking_ids(state_file='tracking_state.json'):
       "existing_id": { ... },
       "new_tracking_id": {}
     }
+
+    Args:
+        state: State already loaded with AnjaniTracker.load_state()
+        state_file: Path the state was loaded from
     """
-    try:
-        with open(state_file, 'r') as f:
-            state = json.load(f)
-            tracking_ids = list(state.keys())
-
-            if not tracking_ids:
-                print("⚠️  No tracking IDs in state file")
-                print(f"Add tracking IDs to {state_file}:")
-                print('{"1566745519": {}, "1234567890": {}}')
-                sys.exit(1)
-
-            return tracking_ids
-    except FileNotFoundError:
+    if not os.path.exists(state_file):
         print(f"⚠️  State file not found: {state_file}")
         print("Creating initial state file...")
         print("Add your tracking IDs as keys:")
@@ -46,10 +37,41 @@ def get_tracking_ids(state_file='tracking_state.json'):
             json.dump({}, f, indent=2)
 
         sys.exit(1)
-    except json.JSONDecodeError:
-        print(f"❌ Invalid JSON in {state_file}")
+
+    tracking_ids = list(state.keys())
+
+    if not tracking_ids:
+        print("⚠️  No tracking IDs in state file")
+        print(f"Add tracking IDs to {state_file}:")
+        print('{"1566745519": {}, "1234567890": {}}')
         sys.exit(1)
 
+    return tracking_ids
+
+
+def keep_entry(previous, tracking_info):
+    """
+    Keep the stored entry for a package whose content hash has not changed
+
+    Only the HTTP validators are refreshed (or dropped, if the fresh result
+    has none), so an unchanged package doesn't bump fetched_at and force a
+    rewrite (and commit) of the state file.
+
+    Args:
+        previous: Stored tracking info from the last run
+        tracking_info: Freshly fetched tracking info
+
+    Returns:
+        dict: Entry to store in the new state
+    """
+    entry = dict(previous)
+    for key in ('etag', 'last_modified', 'validators_from_http'):
+        if key in tracking_info:
+            entry[key] = tracking_info[key]
+        else:
+            entry.pop(key, None)
+    return entry
+
 
 def main():
     print("="*70)
@@ -65,10 +87,13 @@ def main():
         print("Set GOOGLE_CHAT_WEBHOOK environment variable")
         sys.exit(1)
 
+    # Imported here so the early exits above don't pay for loading Playwright
+    from tracker import AnjaniTracker
+
     # Load previous state and get tracking IDs from it
     state_file = 'tracking_state.json'
     previous_state = AnjaniTracker.load_state(state_file)
-    tracking_ids = get_tracking_ids(state_file)
+    tracking_ids = get_tracking_ids(previous_state, state_file)
 
     if not tracking_ids:
         print("❌ No tracking IDs provided in config file")
@@ -78,68 +103,84 @@ def main():
     print(f"💬 Webhook configured: {webhook_url[:50]}...")
     print(f"📂 Loaded previous state: {len(previous_state)} tracked package(s)")
 
-    # Initialize tracker
-    tracker = AnjaniTracker(headless=True)
+    # Initialize tracker; the browser profile dir (restored from the Actions
+    # cache) keeps Chromium's HTTP cache and cookies warm across runs.
+    # Set CHROMIUM_PROFILE_DIR to an empty string to use a fresh browser.
+    tracker = AnjaniTracker(
+        headless=True,
+        user_data_dir=os.environ.get('CHROMIUM_PROFILE_DIR', '.chromium_profile') or None
+    )
 
-    # Track all packages and detect changes
+    # Fetch every package concurrently in one shared browser
+    print(f"\n⏳ Fetching tracking pages...")
+    results = tracker.track_multiple(tracking_ids, previous_state=previous_state)
+
+    # Detect changes; notifications are collected and sent together at the end
     new_state = {}
-    notifications_sent = 0
+    pending_messages = []
     errors = 0
 
-    for tracking_id in tracking_ids:
+    for tracking_id, tracking_info in zip(tracking_ids, results):
         # Extract label from previous state if it exists
-        label = None
-        if tracking_id in previous_state:
-            label = previous_state[tracking_id].get('label')
+        prev = previous_state.get(tracking_id)
+        label = prev.get('label') if prev else None
 
         print(f"\n{'─'*70}")
         label_text = f" ({label})" if label else ""
         print(f"🔍 Checking: {tracking_id}{label_text}")
 
         try:
-            # Get current tracking info
-            tracking_info = tracker.track(tracking_id)
-
             # Add label to tracking info if it exists
             if label:
                 tracking_info['label'] = label
 
+            if tracking_info.get('not_modified'):
+                # Server confirmed nothing changed - keep the stored entry
+                print(f"✓ Not modified since last check")
+                new_state[tracking_id] = prev
+                continue
+
             if tracking_info.get('error'):
                 print(f"❌ Error tracking {tracking_id}: {tracking_info['error']}")
                 errors += 1
-                # Keep old state if tracking fails
-                if tracking_id in previous_state:
-                    new_state[tracking_id] = previous_state[tracking_id]
+                # Keep old state if tracking fails; either way the ID stays in the file
+                new_state[tracking_id] = prev if prev is not None else tracking_info
                 continue
 
-            # Check for changes
-            if tracking_id in previous_state and previous_state[tracking_id]:
-                has_changes, change_list = AnjaniTracker.has_changes(
-                    previous_state[tracking_id],
-                    tracking_info
-                )
+            # Check for changes - identical hashes mean nothing to diff
+            previous_hash = prev.get('content_hash') if prev else None
+            if previous_hash and previous_hash == tracking_info.get('content_hash'):
+                print(f"✓ No changes detected")
+                new_state[tracking_id] = keep_entry(prev, tracking_info)
+                continue
+            elif prev:
+                has_changes, change_list = AnjaniTracker.has_changes(prev, tracking_info)
 
                 if has_changes:
                     print(f"🔔 Changes detected:")
                     for change in change_list:
                         print(f"   • {change}")
 
-                    # Send notification
-                    success = tracker.send_to_google_chat(tracking_info, webhook_url)
-                    if success:
-                        notifications_sent += 1
+                    # Queue notification
+                    pending_messages.append(tracker.format_message(tracking_info))
                 else:
+                    # Nothing worth a notification (e.g. rows reordered or
+                    # dropped), but store what the page shows now so the
+                    # state and its content hash stay in step with it
                     print(f"✓ No changes detected")
+                    new_state[tracking_id] = dict(
+                        tracking_info,
+                        fetched_at=prev.get('fetched_at', tracking_info['fetched_at'])
+                    )
+                    continue
             else:
                 # First time tracking this package
                 print(f"🆕 First time tracking this package")
                 print(f"📊 Status: {tracking_info.get('status', 'Unknown')}")
-                print(f"📋 Checkpoints: {len(tracking_info.get('checkpoints', []))}")
+                print(f"📋 Checkpoints: {len(tracking_info.get('checkpoints') or [])}")
 
-                # Send initial notification
-                success = tracker.send_to_google_chat(tracking_info, webhook_url)
-                if success:
-                    notifications_sent += 1
+                # Queue initial notification
+                pending_messages.append(tracker.format_message(tracking_info))
 
             # Save to new state
             new_state[tracking_id] = tracking_info
@@ -148,13 +189,21 @@ def main():
             print(f"❌ Unexpected error processing {tracking_id}: {str(e)}")
             errors += 1
             # Keep old state if error occurs
-            if tracking_id in previous_state:
-                new_state[tracking_id] = previous_state[tracking_id]
+            if prev is not None:
+                new_state[tracking_id] = prev
 
-    # Save updated state
-    AnjaniTracker.save_state(new_state, state_file)
     print(f"\n{'─'*70}")
-    print(f"💾 Saved state to: {state_file}")
+
+    # Send all queued notifications in as few webhook calls as possible
+    notifications_sent = 0
+    if pending_messages:
+        notifications_sent = tracker.send_batch_to_google_chat(pending_messages, webhook_url)
+
+    # Save updated state (skipped when nothing in it changed)
+    if AnjaniTracker.save_state(new_state, state_file):
+        print(f"💾 Saved state to: {state_file}")
+    else:
+        print(f"💾 State unchanged, not rewriting: {state_file}")
 
     # Summary
     print("\n" + "="*70)
@@ -5,134 +5,848 @@ Tracks packages on https://trackcourier.io/anjani-courier-tracking
 Uses Playwright to handle dynamic JavaScript content
 """
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import sync_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
 from datetime import datetime
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import sys
 import json
+import os
 import re
+import shutil
+import time
+from urllib.parse import urlparse
+from lxml import etree
+import lxml.html
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, stdlib json is used without it
+    orjson = None
+
+
+_DATE_RE = re.compile(r'(\d{1,2}-(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{4})')
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM))')
+_ACTIVITY_RE = re.compile(r'\[.*?\]|IN TRANSIT|DELIVERED|ON WAY|IN |OUT', re.IGNORECASE)
+
+# A line holding a checkpoint date plus up to four following lines. The match
+# itself is zero-width (lookahead) so overlapping blocks are all found in a
+# single pass over the page text.
+_CHECKPOINT_BLOCK_RE = re.compile(
+    r'^(?=(.*\d{1,2}-(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{4}.*(?:\n.*){0,4}))',
+    re.MULTILINE
+)
+
+# Every status keyword in one alternation; _STATUS_PRIORITY decides which one
+# wins when the page mentions several (e.g. history rows plus current status).
+_STATUS_RE = re.compile(r'\b(IN[- ]TRANSIT|OUT FOR DELIVERY|DELIVERED|PENDING)\b', re.IGNORECASE)
+_STATUS_PRIORITY = ('IN TRANSIT', 'DELIVERED', 'PENDING', 'OUT FOR DELIVERY')
+_STATUS_EMOJI = {
+    'DELIVERED': '✅',
+    'IN TRANSIT': '🚛',
+    'PENDING': '⏳',
+    'OUT FOR DELIVERY': '🚚'
+}
+
+# Resources the scraper never looks at; aborting them speeds up page loads.
+# Stylesheets are kept because innerText depends on the rendered layout.
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+_BLOCKED_HOSTS = (
+    'googletagmanager.com', 'google-analytics.com', 'doubleclick.net',
+    'googlesyndication.com', 'googleadservices.com', 'facebook.net'
+)
+
+# Chromium features a headless text scraper never uses; turning them off
+# shortens cold start, which is most of the cost in a one-shot CI run.
+_CHROMIUM_ARGS = [
+    '--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage',
+    '--disable-extensions', '--disable-background-networking',
+    '--disable-default-apps', '--disable-translate', '--disable-sync',
+    '--metrics-recording-only', '--no-first-run', '--mute-audio',
+    '--disable-renderer-backgrounding', '--disable-background-timer-throttling'
+]
+_VIEWPORT = {'width': 1024, 'height': 768}
+
+# Playwright timeouts (ms): navigation, and everything else on a page
+_NAVIGATION_TIMEOUT_MS = 45000
+_PAGE_TIMEOUT_MS = 30000
+
+# Transient failures (navigation network errors, Chat 429/5xx) are tried
+# this many times in total, sleeping 0.5s, 1s, 2s... in between
+_MAX_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.5
+_CHAT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# A persistent browser profile past this size is wiped and started fresh
+_PROFILE_MAX_BYTES = 50 * 1024 * 1024
+# Chromium's own disk cache inside the profile is capped well below that
+_PROFILE_ARGS = _CHROMIUM_ARGS + ['--disk-cache-size=20971520']
+
+# Runs in the page: true once a list item with a checkpoint date has rendered.
+# Reading innerText forces layout, so it is polled on an interval rather
+# than on every animation frame
+_CHECKPOINTS_POLL_MS = 250
+# Budget for checkpoints to appear before parsing whatever rendered; kept
+# separate from the page default so pages without any don't wait longer
+_CHECKPOINTS_WAIT_MS = 20000
+_CHECKPOINTS_READY_JS = r'''
+    () => {
+        var dateRe = /\d{1,2}-(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{4}/;
+        return Array.from(document.querySelectorAll('ul li'))
+            .some(function(li) { return dateRe.test(li.innerText); });
+    }
+'''
+
+# Runs in the page and returns only what the tracker needs: the status
+# keywords found in the body text (_STATUS_RE) and every list item that
+# contains a date, parsed into a {date, time, activity, location} object
+# mirroring _parse_checkpoint
+_TRACKING_DATA_JS = r'''
+    () => {
+        var statusRe = /\b(IN[- ]TRANSIT|OUT FOR DELIVERY|DELIVERED|PENDING)\b/gi;
+        var monthRe = /-(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-/;
+        var dateRe = /(\d{1,2}-(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{4})/;
+        var timeRe = /(\d{1,2}:\d{2}\s*(?:AM|PM))/;
+        var activityRe = /\[.*?\]|IN TRANSIT|DELIVERED|ON WAY|IN |OUT/i;
+        var placeWords = ['EAST', 'WEST', 'NORTH', 'SOUTH', 'NAGAR', 'ROAD'];
+
+        function firstMatch(lines, re) {
+            for (var i = 0; i < lines.length; i++) {
+                var m = re.exec(lines[i]);
+                if (m) return m[1];
+            }
+            return '';
+        }
+
+        function isUpper(line) {
+            return line === line.toUpperCase() && line !== line.toLowerCase();
+        }
+
+        function parseCheckpoint(text) {
+            var lines = text.split('\n')
+                .map(function(line) { return line.trim(); })
+                .filter(function(line) { return line; });
+            var date = firstMatch(lines, dateRe);
+            var time = firstMatch(lines, timeRe);
+            var activities = [];
+            var locations = [];
+
+            lines.forEach(function(line) {
+                if (line === date || (time && line === time) || line === 'Anjani Courier') return;
+
+                if (line.indexOf('-') > -1 && !dateRe.test(line)) {
+                    locations.push(line);
+                } else if (activityRe.test(line)) {
+                    activities.push(line);
+                } else if (isUpper(line) || placeWords.some(function(word) {
+                    return line.toUpperCase().indexOf(word) > -1;
+                })) {
+                    locations.push(line);
+                } else {
+                    activities.push(line);
+                }
+            });
+
+            return {
+                date: date,
+                time: time,
+                activity: activities.join(' - '),
+                location: locations[0] || ''
+            };
+        }
+
+        return {
+            statuses: (document.body.innerText || '').match(statusRe) || [],
+            checkpoints: Array.from(document.querySelectorAll('ul li'))
+                .map(function(li) { return li.innerText; })
+                .filter(function(text) { return !!text && monthRe.test(text); })
+                .map(parseCheckpoint)
+        };
+    }
+'''
+
+# Compiled XPaths for the plain-HTTP path (server-rendered HTML)
+_XPATH_NON_TEXT = etree.XPath('//script | //style | //noscript | //template')
+_XPATH_LINE_BREAKS = etree.XPath(
+    '//br | //p | //div | //li | //ul | //ol | //dl | //dt | //dd | //tr | //table'
+    ' | //section | //article | //header | //footer | //nav | //main | //aside'
+    ' | //h1 | //h2 | //h3 | //h4 | //h5 | //h6 | //pre | //blockquote | //hr'
+)
+# List items holding a checkpoint date. The date test (EXSLT regex) is part
+# of the compiled expression, so only checkpoint rows come back
+_XPATH_CHECKPOINT_ITEMS = etree.XPath(
+    r"//ul/li[re:test(., '\d{1,2}-(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{4}')]",
+    namespaces={'re': 'http://exslt.org/regular-expressions'}
+)
+
+
+_CHECKPOINT_FIELDS = ('date', 'time', 'activity', 'location')
+
+
+def _checkpoint_key(checkpoint):
+    """
+    Hashable fingerprint of a checkpoint: (date, time, activity, location)
+
+    Whitespace runs (including NBSP and tabs) collapse to one space, since
+    the browser's innerText and the plain-HTTP text differ there and the
+    same checkpoint must compare equal whichever path read it.
+    """
+    return tuple(' '.join((checkpoint.get(field) or '').split()) for field in _CHECKPOINT_FIELDS)
 
 
 class AnjaniTracker:
     """Tracker for Anjani Courier packages using Playwright"""
 
     BASE_URL = "https://trackcourier.io/track-and-trace/anjani-courier"
+    USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, cache_ttl=60, user_data_dir=None):
         """
         Initialize the tracker
 
         Args:
             headless: Run browser in headless mode (default: True)
+            cache_ttl: Seconds a successful result is reused for repeat
+                lookups of the same tracking number (default: 60, 0 disables)
+            user_data_dir: Optional Chromium profile directory kept between
+                runs, so the HTTP cache and cookies stay warm. All lookups
+                then share the profile's single context instead of getting
+                a fresh one each (default: None, no profile)
         """
         self.headless = headless
+        self.cache_ttl = cache_ttl
+        self.user_data_dir = user_data_dir
+        self._cache = {}
+
+        # Shared by page fetches (trackcourier.io) and webhook posts
+        # (chat.googleapis.com): keep a pool per host alive across requests
+        # and retry idempotent requests on gateway errors
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods={'GET'}
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
-    def track(self, tracking_number):
-        """
-        Track a package by tracking number
+        self._playwright = None
+        self._browser = None
+        self._keep_open = False
 
-        Args:
-            tracking_number: The tracking ID to look up
+    def __enter__(self):
+        """Keep the browser open across track() calls until the block exits"""
+        self._keep_open = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._keep_open = False
+        self.close()
+
+    def _ensure_browser(self):
+        """
+        Launch the shared browser on first use
 
         Returns:
-            dict: Tracking information including status and checkpoints
+            Browser or BrowserContext: Browser that per-package contexts are
+            created in, or the persistent context when user_data_dir is set
         """
-        url = f"{self.BASE_URL}/{tracking_number}"
+        if (self._browser is not None and not self.user_data_dir
+                and not self._browser.is_connected()):
+            # Browser crashed or was killed - start over with a fresh one
+            self._close_browser()
+
+        if self._browser is None:
+            self._playwright = sync_playwright().start()
+            if self.user_data_dir:
+                self._limit_profile_size(self.user_data_dir)
+                self._browser = self._playwright.chromium.launch_persistent_context(
+                    self.user_data_dir, headless=self.headless, args=_PROFILE_ARGS,
+                    user_agent=self.USER_AGENT, viewport=_VIEWPORT
+                )
+                self._browser.route('**/*', self._route_request)
+            else:
+                self._browser = self._playwright.chromium.launch(
+                    headless=self.headless, args=_CHROMIUM_ARGS
+                )
+
+        return self._browser
+
+    @staticmethod
+    def _limit_profile_size(user_data_dir):
+        """Wipe the browser profile if it has grown past _PROFILE_MAX_BYTES"""
+        size = 0
+        for root, _dirs, files in os.walk(user_data_dir):
+            for name in files:
+                try:
+                    size += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+
+        if size > _PROFILE_MAX_BYTES:
+            print(f"🧹 Browser profile is {size // (1024 * 1024)} MB, starting a fresh one")
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+
+    def close(self):
+        """Close the shared browser and drop pooled HTTP connections"""
+        self._close_browser()
+        self.session.close()
 
-        tracking_info = {
+    def _close_browser(self):
+        """Close the shared browser and stop Playwright"""
+        try:
+            if self._browser is not None:
+                self._browser.close()
+        except Exception:
+            pass
+        finally:
+            if self._playwright is not None:
+                self._playwright.stop()
+            self._playwright = None
+            self._browser = None
+
+    def _new_tracking_info(self, tracking_number):
+        """Build an empty tracking info dict for a tracking number"""
+        return {
             'tracking_number': tracking_number,
             'courier': 'Anjani Courier',
             'status': None,
             'checkpoints': [],
-            'url': url,
+            'url': f"{self.BASE_URL}/{tracking_number}",
             'fetched_at': datetime.now().isoformat(),
             'error': None
         }
 
+    def track(self, tracking_number, previous=None, force_refresh=False):
+        """
+        Track a package by tracking number
+
+        The page is first fetched over plain HTTP; the browser is only used
+        when the server-rendered HTML has no checkpoints in it. It is launched
+        on demand and, outside a ``with tracker:`` block, closed again before
+        returning; inside one it is reused. Each package gets its own
+        browser context, so no cookies or storage leak between lookups
+        (unless a persistent profile is used, see ``user_data_dir``).
+
+        Args:
+            tracking_number: The tracking ID to look up
+            previous: Tracking info from the last run; if the server reports
+                the page as not modified since then, it is returned as-is
+                (flagged with ``not_modified``) without opening the browser
+            force_refresh: Ignore a cached result from the last ``cache_ttl``
+                seconds and fetch again
+
+        Returns:
+            dict: Tracking information including status and checkpoints
+        """
+        if not force_refresh:
+            cached = self._get_cached(tracking_number)
+            if cached is not None:
+                return cached
+
+        result = self._track_without_browser(tracking_number, previous)
+        if result is None:
+            result = self._track_in_browser(tracking_number)
+
+        self._store_cached(result)
+        return result
+
+    def _track_in_browser(self, tracking_number):
+        """Render the tracking page in the shared sync browser and parse it"""
+        tracking_info = self._new_tracking_info(tracking_number)
+        url = tracking_info['url']
+
         try:
-            with sync_playwright() as p:
-                # Launch browser
-                browser = p.chromium.launch(headless=self.headless)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                )
+            browser = self._ensure_browser()
+            if self.user_data_dir:
+                # Lookups share the persistent profile's context (and its cache)
+                context = None
+                page = browser.new_page()
+            else:
+                context = browser.new_context(user_agent=self.USER_AGENT, viewport=_VIEWPORT)
+                context.route('**/*', self._route_request)
                 page = context.new_page()
+            page.set_default_timeout(_PAGE_TIMEOUT_MS)
+            page.set_default_navigation_timeout(_NAVIGATION_TIMEOUT_MS)
 
+            try:
                 # Navigate to tracking page
-                page.goto(url, wait_until='networkidle', timeout=60000)
-
-                # Wait for content to load - site takes long to load dynamic content
-                page.wait_for_timeout(20000)
-
-                # Extract status
-                page_text = page.inner_text('body')
-                status_patterns = [
-                    (r'IN TRANSIT|IN-TRANSIT', 'IN TRANSIT'),
-                    (r'DELIVERED', 'DELIVERED'),
-                    (r'PENDING', 'PENDING'),
-                    (r'OUT FOR DELIVERY', 'OUT FOR DELIVERY')
-                ]
-
-                for pattern, status_name in status_patterns:
-                    if re.search(pattern, page_text, re.IGNORECASE):
-                        tracking_info['status'] = status_name
-                        break
-
-                # Extract checkpoints using JavaScript
+                # Validators aren't recorded here: the document's ETag /
+                # Last-Modified don't cover checkpoints rendered by JavaScript
+                self._goto(page, url)
+
+                # Wait for the dynamically rendered checkpoints to show up
                 try:
-                    checkpoint_texts = page.evaluate('''
-                        () => {
-                            return Array.from(document.querySelectorAll('ul li'))
-                                .map(function(li) { return li.innerText; })
-                                .filter(function(text) {
-                                    if (!text) return false;
-                                    var months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-                                    for (var i = 0; i < months.length; i++) {
-                                        if (text.indexOf('-' + months[i] + '-') > -1) {
-                                            return true;
-                                        }
-                                    }
-                                    return false;
-                                });
-                        }
-                    ''')
-
-                    # Debug: print what we got
-                    if not checkpoint_texts:
-                        # Try alternative selector
-                        all_text = page.inner_text('body')
-                        if 'Jan-2026' in all_text or 'BANDRA' in all_text:
-                            # Data is there but not extracted, parse from full text
-                            lines = all_text.split('\n')
-                            temp_text = []
-                            for i, line in enumerate(lines):
-                                if re.search(r'\d{1,2}-(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{4}', line):
-                                    # Collect this line and next few lines
-                                    block = []
-                                    for j in range(min(5, len(lines) - i)):
-                                        block.append(lines[i + j])
-                                    temp_text.append('\n'.join(block))
-                            checkpoint_texts = temp_text
-
-                    # Parse checkpoint texts
-                    for cp_text in checkpoint_texts:
-                        checkpoint = self._parse_checkpoint(cp_text)
-                        if checkpoint['date']:
-                            tracking_info['checkpoints'].append(checkpoint)
-
-                except Exception as e:
-                    tracking_info['error'] = f'Error extracting checkpoints: {str(e)}'
-
-                # Close browser
-                browser.close()
+                    page.wait_for_function(
+                        _CHECKPOINTS_READY_JS, polling=_CHECKPOINTS_POLL_MS, timeout=_CHECKPOINTS_WAIT_MS
+                    )
+                except PlaywrightTimeoutError:
+                    # Nothing rendered in time - parse whatever the page has
+                    pass
+
+                # Status keywords and parsed checkpoints in one round trip
+                page_data = page.evaluate(_TRACKING_DATA_JS)
+                if not self._apply_page_data(tracking_info, page_data):
+                    # Fall back to scanning the whole page text
+                    self._apply_page_data(tracking_info, page_data, page.inner_text('body'))
+
+            finally:
+                if context is not None:
+                    context.close()
+                else:
+                    page.close()
 
         except PlaywrightTimeoutError:
             tracking_info['error'] = 'Timeout loading tracking page'
         except Exception as e:
             tracking_info['error'] = f'Error: {str(e)}'
+        finally:
+            if not self._keep_open:
+                self._close_browser()
+
+        return tracking_info
+
+    def _apply_page_data(self, tracking_info, page_data, body_text=None):
+        """
+        Fill in status, checkpoints and content hash from the page script
+
+        Shared by the sync and async browser paths.
+
+        Args:
+            tracking_info: Tracking info dict to update
+            page_data: Result of evaluating _TRACKING_DATA_JS
+            body_text: Full page text, scanned for checkpoints when the
+                script found none (optional)
+
+        Returns:
+            bool: False if the script found no checkpoints and no body_text
+            was given, i.e. the caller should retry with the page text
+        """
+        tracking_info['status'] = self._extract_status('\n'.join(page_data['statuses']))
+
+        try:
+            checkpoints = self._unique_checkpoints(page_data['checkpoints'])
+
+            if not checkpoints:
+                if body_text is None:
+                    return False
+                checkpoints = self._parse_checkpoints(self._checkpoint_blocks(body_text))
+
+            tracking_info['checkpoints'] = checkpoints
+            tracking_info['content_hash'] = self.content_hash(tracking_info)
+
+        except Exception as e:
+            tracking_info['error'] = f'Error extracting checkpoints: {str(e)}'
+
+        return True
+
+    async def track_async(self, tracking_number, browser):
+        """
+        Track a package in its own context of an async Playwright browser
+
+        Args:
+            tracking_number: The tracking ID to look up
+            browser: playwright.async_api Browser to open the context in, or
+                the persistent BrowserContext to open a page in when
+                user_data_dir is set
+
+        Returns:
+            dict: Tracking information including status and checkpoints
+        """
+        tracking_info = self._new_tracking_info(tracking_number)
+        url = tracking_info['url']
+
+        try:
+            if self.user_data_dir:
+                context = None
+                page = await browser.new_page()
+            else:
+                context = await browser.new_context(user_agent=self.USER_AGENT, viewport=_VIEWPORT)
+                await context.route('**/*', self._route_request)
+                page = await context.new_page()
+            page.set_default_timeout(_PAGE_TIMEOUT_MS)
+            page.set_default_navigation_timeout(_NAVIGATION_TIMEOUT_MS)
+
+            try:
+                await self._goto_async(page, url)
+
+                try:
+                    await page.wait_for_function(
+                        _CHECKPOINTS_READY_JS, polling=_CHECKPOINTS_POLL_MS, timeout=_CHECKPOINTS_WAIT_MS
+                    )
+                except PlaywrightTimeoutError:
+                    pass
+
+                page_data = await page.evaluate(_TRACKING_DATA_JS)
+                if not self._apply_page_data(tracking_info, page_data):
+                    self._apply_page_data(tracking_info, page_data, await page.inner_text('body'))
+
+            finally:
+                if context is not None:
+                    await context.close()
+                else:
+                    await page.close()
+
+        except PlaywrightTimeoutError:
+            tracking_info['error'] = 'Timeout loading tracking page'
+        except Exception as e:
+            tracking_info['error'] = f'Error: {str(e)}'
+
+        return tracking_info
+
+    async def track_multiple_async(self, tracking_numbers, concurrency=8, previous_state=None,
+                                   force_refresh=False):
+        """
+        Track multiple packages concurrently in one shared browser
+
+        Args:
+            tracking_numbers: List of tracking IDs
+            concurrency: Maximum number of pages loading at once (default: 8)
+            previous_state: Optional state dict from the last run, used for
+                conditional requests (see track())
+            force_refresh: Ignore cached results (see track())
+
+        Returns:
+            list: Tracking information dicts, in the same order as tracking_numbers
+        """
+        results, pending = await asyncio.to_thread(
+            self._resolve_without_browser, tracking_numbers, previous_state, concurrency, force_refresh
+        )
+
+        if pending:
+            fetched = await self._track_pages_async(pending, concurrency)
+            for tracking_number, tracking_info in zip(pending, fetched):
+                results[tracking_number] = tracking_info
+                self._store_cached(tracking_info)
+
+        return [results[tn] for tn in tracking_numbers]
+
+    def _resolve_without_browser(self, tracking_numbers, previous_state, concurrency, force_refresh):
+        """
+        Resolve what can be answered without the browser
+
+        Shared by the sync and async paths of track_multiple().
+
+        Args:
+            tracking_numbers: List of tracking IDs
+            previous_state: State dict from the last run (may be None)
+            concurrency: Maximum number of HTTP requests in flight at once
+            force_refresh: Ignore cached results
+
+        Returns:
+            tuple: (dict, list) - (tracking info by tracking number from the
+            cache or plain HTTP, tracking numbers still needing the browser)
+        """
+        results = {}
+        if not force_refresh:
+            for tracking_number in tracking_numbers:
+                cached = self._get_cached(tracking_number)
+                if cached is not None:
+                    results[tracking_number] = cached
+
+        # Unchanged and server-rendered pages are handled without the browser
+        pending = list(dict.fromkeys(tn for tn in tracking_numbers if tn not in results))
+        results.update(self._track_many_without_browser(pending, previous_state or {}, concurrency))
+
+        return results, [tn for tn in pending if tn not in results]
+
+    def _track_many_without_browser(self, tracking_numbers, previous_state, concurrency):
+        """
+        Run _track_without_browser for many packages on a bounded thread pool
+
+        Args:
+            tracking_numbers: List of tracking IDs
+            previous_state: State dict from the last run
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            dict: Tracking info by tracking number, only for packages that
+            were resolved without the browser (these are also cached)
+        """
+        if not tracking_numbers:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(tracking_numbers))) as executor:
+            quick_results = executor.map(
+                lambda tn: self._track_without_browser(tn, previous_state.get(tn)),
+                tracking_numbers
+            )
+            results = {
+                tn: result for tn, result in zip(tracking_numbers, quick_results)
+                if result is not None
+            }
+
+        for result in results.values():
+            self._store_cached(result)
+        return results
+
+    def _get_cached(self, tracking_number):
+        """Return a copy of a result cached within the last cache_ttl seconds, if any"""
+        hit = self._cache.get(tracking_number)
+        if hit is None or time.monotonic() - hit[0] >= self.cache_ttl:
+            return None
+        return copy.deepcopy(hit[1])
+
+    def _store_cached(self, tracking_info):
+        """Cache a successful result; errors are never cached"""
+        if self.cache_ttl > 0 and not tracking_info.get('error'):
+            self._cache[tracking_info['tracking_number']] = (time.monotonic(), copy.deepcopy(tracking_info))
+
+    async def _track_pages_async(self, tracking_numbers, concurrency):
+        """Scrape tracking pages concurrently, one context each, in one browser"""
+        async with async_playwright() as p:
+            try:
+                if self.user_data_dir:
+                    # One persistent context stands in for the browser
+                    self._limit_profile_size(self.user_data_dir)
+                    browser = await p.chromium.launch_persistent_context(
+                        self.user_data_dir, headless=self.headless, args=_PROFILE_ARGS,
+                        handle_sigint=False, user_agent=self.USER_AGENT, viewport=_VIEWPORT
+                    )
+                    await browser.route('**/*', self._route_request)
+                else:
+                    browser = await p.chromium.launch(
+                        headless=self.headless, args=_CHROMIUM_ARGS, handle_sigint=False
+                    )
+            except Exception as e:
+                # No browser means no package can be tracked this run
+                results = [self._new_tracking_info(tn) for tn in tracking_numbers]
+                for tracking_info in results:
+                    tracking_info['error'] = f'Error: {str(e)}'
+                return results
+
+            try:
+                semaphore = asyncio.Semaphore(concurrency)
+
+                async def track_bounded(tracking_number):
+                    async with semaphore:
+                        return await self.track_async(tracking_number, browser)
+
+                return await asyncio.gather(*(track_bounded(tn) for tn in tracking_numbers))
+            finally:
+                await browser.close()
+
+    def _track_without_browser(self, tracking_number, previous):
+        """
+        Resolve a package over plain HTTP where possible
+
+        Returns:
+            dict or None: The previous info if the page is not modified, fresh
+            info if the HTML already holds checkpoints, or None when the page
+            has to be rendered in the browser
+        """
+        if self._check_not_modified(tracking_number, previous):
+            return dict(previous, not_modified=True)
+
+        return self._track_http(tracking_number)
+
+    def _track_http(self, tracking_number):
+        """
+        Track a package from the server-rendered HTML, without a browser
+
+        Args:
+            tracking_number: The tracking ID to look up
+
+        Returns:
+            dict or None: Tracking information, or None if the HTML holds no
+            checkpoints (e.g. they are rendered by JavaScript)
+        """
+        tracking_info = self._new_tracking_info(tracking_number)
 
+        try:
+            response = self.session.get(
+                tracking_info['url'],
+                headers={'User-Agent': self.USER_AGENT},
+                timeout=15
+            )
+            response.raise_for_status()
+            tree = lxml.html.fromstring(response.content)
+        except (requests.exceptions.RequestException, etree.ParserError):
+            return None
+
+        # Approximate the browser's innerText: drop non-visible content and
+        # put block-level elements on their own lines
+        for element in _XPATH_NON_TEXT(tree):
+            element.drop_tree()
+        for element in _XPATH_LINE_BREAKS(tree):
+            if element.tag != 'br':
+                element.text = '\n' + (element.text or '')
+            element.tail = '\n' + (element.tail or '')
+
+        checkpoint_texts = [
+            self._normalize_text(item.text_content()) for item in _XPATH_CHECKPOINT_ITEMS(tree)
+        ]
+
+        checkpoints = self._parse_checkpoints(checkpoint_texts)
+        if not checkpoints:
+            return None
+
+        body = tree.body if tree.body is not None else tree
+        tracking_info['status'] = self._extract_status(self._normalize_text(body.text_content()))
+        tracking_info['checkpoints'] = checkpoints
+        tracking_info['content_hash'] = self.content_hash(tracking_info)
+        self._record_validators(tracking_info, response.headers)
         return tracking_info
 
+    @staticmethod
+    def _normalize_text(text):
+        """Collapse whitespace within lines and drop blank lines"""
+        lines = (' '.join(line.split()) for line in text.split('\n'))
+        return '\n'.join(line for line in lines if line)
+
+    def _check_not_modified(self, tracking_number, previous):
+        """
+        Probe the page with a conditional HEAD using the validators saved
+        from the last run
+
+        Servers that ignore conditional headers on HEAD still count as
+        unchanged when they answer with the same ETag / Last-Modified, but
+        only if those were saved by the plain-HTTP path (whose checkpoints
+        came from the same response).
+
+        Args:
+            tracking_number: The tracking ID to check
+            previous: Tracking info from the last run (may be None)
+
+        Returns:
+            bool: True only if the server reports the page as unchanged
+        """
+        if not previous or previous.get('error'):
+            return False
+
+        headers = {}
+        if previous.get('etag'):
+            headers['If-None-Match'] = previous['etag']
+        if previous.get('last_modified'):
+            headers['If-Modified-Since'] = previous['last_modified']
+        if not headers:
+            return False
+
+        headers['User-Agent'] = self.USER_AGENT
+        try:
+            response = self.session.head(
+                f"{self.BASE_URL}/{tracking_number}",
+                headers=headers,
+                allow_redirects=True,
+                timeout=10
+            )
+        except requests.exceptions.RequestException:
+            return False
+
+        if response.status_code == 304:
+            return True
+        if response.status_code != 200 or not previous.get('validators_from_http'):
+            # HEAD not supported, page gone, or validators we can't trust
+            # to cover the checkpoints - take the full path
+            return False
+
+        etag = response.headers.get('etag')
+        if etag and previous.get('etag'):
+            return etag == previous['etag']
+        last_modified = response.headers.get('last-modified')
+        return bool(last_modified) and last_modified == previous.get('last_modified')
+
+    @staticmethod
+    def _goto(page, url):
+        """
+        Navigate to url, retrying transient network errors with exponential
+        backoff
+
+        Timeouts are raised straight away, so a hung page costs one
+        navigation timeout rather than one per attempt.
+        """
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return page.goto(url, wait_until='domcontentloaded')
+            except PlaywrightTimeoutError:
+                raise
+            except PlaywrightError:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+    @staticmethod
+    async def _goto_async(page, url):
+        """Async version of _goto()"""
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return await page.goto(url, wait_until='domcontentloaded')
+            except PlaywrightTimeoutError:
+                raise
+            except PlaywrightError:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+    @staticmethod
+    def _record_validators(tracking_info, headers):
+        """
+        Keep the page's ETag / Last-Modified for conditional requests next run
+
+        Only used by the plain-HTTP path, where the checkpoints were read
+        from the same response the validators describe.
+        """
+        if headers.get('etag'):
+            tracking_info['etag'] = headers['etag']
+        if headers.get('last-modified'):
+            tracking_info['last_modified'] = headers['last-modified']
+        if 'etag' in tracking_info or 'last_modified' in tracking_info:
+            # Marks validators that describe the checkpoints themselves, see
+            # _check_not_modified()
+            tracking_info['validators_from_http'] = True
+
+    @staticmethod
+    def _route_request(route):
+        """Abort images, fonts, media and tracker requests; let the rest through"""
+        request = route.request
+        host = urlparse(request.url).hostname or ''
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or host.endswith(_BLOCKED_HOSTS):
+            return route.abort()
+        return route.continue_()
+
+    @staticmethod
+    def _extract_status(page_text):
+        """Return the highest-priority status keyword found in the page text"""
+        found = {m.upper().replace('-', ' ') for m in _STATUS_RE.findall(page_text)}
+        return next((status for status in _STATUS_PRIORITY if status in found), None)
+
+    @staticmethod
+    def _checkpoint_blocks(all_text):
+        """Cut checkpoint text blocks (a dated line plus the next four) out of the page text"""
+        return _CHECKPOINT_BLOCK_RE.findall(all_text)
+
+    def _parse_checkpoints(self, checkpoint_texts):
+        """Parse checkpoint texts, dropping any without a date and any repeats"""
+        return self._unique_checkpoints(self._parse_checkpoint(cp_text) for cp_text in checkpoint_texts)
+
+    @staticmethod
+    def _unique_checkpoints(checkpoints):
+        """
+        Keep well-formed, dated checkpoints, dropping repeats
+
+        Nested list items and overlapping fallback blocks can yield the same
+        checkpoint twice; the first occurrence of each is kept. Fields are
+        stored whitespace-normalized (see _checkpoint_key), so both the
+        browser and the plain-HTTP path produce the same content hash.
+        """
+        unique = {}
+        for checkpoint in checkpoints:
+            if isinstance(checkpoint, dict) and checkpoint.get('date'):
+                key = _checkpoint_key(checkpoint)
+                unique.setdefault(key, dict(zip(_CHECKPOINT_FIELDS, key)))
+        return list(unique.values())
+
     def _parse_checkpoint(self, text):
         """Parse a checkpoint text into structured data"""
         checkpoint = {
@@ -142,23 +856,16 @@ class AnjaniTracker:
             'location': ''
         }
 
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = [line for line in map(str.strip, text.split('\n')) if line]
 
-        # Extract date
-        date_pattern = r'(\d{1,2}-(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{4})'
-        for line in lines:
-            date_match = re.search(date_pattern, line)
-            if date_match:
-                checkpoint['date'] = date_match.group(1)
-                break
+        # Extract date and time (first match of each)
+        date_match = next(filter(None, map(_DATE_RE.search, lines)), None)
+        if date_match:
+            checkpoint['date'] = date_match.group(1)
 
-        # Extract time
-        time_pattern = r'(\d{1,2}:\d{2}\s*(?:AM|PM))'
-        for line in lines:
-            time_match = re.search(time_pattern, line)
-            if time_match:
-                checkpoint['time'] = time_match.group(1)
-                break
+        time_match = next(filter(None, map(_TIME_RE.search, lines)), None)
+        if time_match:
+            checkpoint['time'] = time_match.group(1)
 
         # Extract activity and location
         activity_candidates = []
@@ -174,10 +881,10 @@ class AnjaniTracker:
                 continue
 
             # Lines with dashes (like BANDRA-EAST) are likely locations
-            if '-' in line and not re.search(date_pattern, line):
+            if '-' in line and not _DATE_RE.search(line):
                 location_candidates.append(line)
             # Status/activity indicators
-            elif re.search(r'\[.*?\]|IN TRANSIT|DELIVERED|ON WAY|IN |OUT', line, re.IGNORECASE):
+            elif _ACTIVITY_RE.search(line):
                 activity_candidates.append(line)
             # Other lines
             else:
@@ -195,21 +902,42 @@ class AnjaniTracker:
 
         return checkpoint
 
-    def track_multiple(self, tracking_numbers):
+    def track_multiple(self, tracking_numbers, concurrency=8, previous_state=None, force_refresh=False):
         """
         Track multiple packages
 
+        Packages are fetched concurrently via track_multiple_async(). If the
+        sync browser is already running (inside ``with tracker:``) it is
+        reused instead: the plain-HTTP checks still run on a thread pool,
+        but pages that need the browser are rendered one at a time, because
+        the sync API is bound to this thread and its event loop.
+
         Args:
             tracking_numbers: List of tracking IDs
+            concurrency: Maximum number of pages loading at once (default: 8)
+            previous_state: Optional state dict from the last run, used for
+                conditional requests (see track())
+            force_refresh: Ignore cached results (see track())
 
         Returns:
             list: List of tracking information dicts
         """
-        results = []
-        for tracking_number in tracking_numbers:
-            result = self.track(tracking_number)
-            results.append(result)
-        return results
+        if self._browser is not None:
+            results, pending = self._resolve_without_browser(
+                tracking_numbers, previous_state, concurrency, force_refresh
+            )
+            for tracking_number in pending:
+                results[tracking_number] = self._track_in_browser(tracking_number)
+                self._store_cached(results[tracking_number])
+
+            return [results[tn] for tn in tracking_numbers]
+
+        return asyncio.run(self.track_multiple_async(
+            tracking_numbers,
+            concurrency=concurrency,
+            previous_state=previous_state,
+            force_refresh=force_refresh
+        ))
 
     def print_tracking_info(self, tracking_info):
         """Pretty print tracking information"""
@@ -223,13 +951,7 @@ class AnjaniTracker:
         print(f"🚚 Courier: {tracking_info['courier']}")
 
         if tracking_info['status']:
-            status_emoji = {
-                'DELIVERED': '✅',
-                'IN TRANSIT': '🚛',
-                'PENDING': '⏳',
-                'OUT FOR DELIVERY': '🚚'
-            }
-            emoji = status_emoji.get(tracking_info['status'], '📍')
+            emoji = _STATUS_EMOJI.get(tracking_info['status'], '📍')
             print(f"{emoji} Status: {tracking_info['status']}")
 
         print(f"🔗 URL: {tracking_info['url']}")
@@ -264,6 +986,46 @@ class AnjaniTracker:
 
         print(f"💾 Saved tracking data to: {filename}")
 
+    def format_message(self, tracking_info):
+        """
+        Build the Google Chat message text for a package
+
+        Args:
+            tracking_info: Dictionary containing tracking information
+
+        Returns:
+            str: Message text using Google Chat formatting
+        """
+        emoji = _STATUS_EMOJI.get(tracking_info.get('status', ''), '📍')
+
+        # Build title with optional label
+        title = f"📦 Package Update - {tracking_info['tracking_number']}"
+        if tracking_info.get('label'):
+            title = f"📦 {tracking_info['label']} ({tracking_info['tracking_number']})"
+
+        message_lines = [
+            f"*{title}*",
+            f"{emoji} *Status:* {tracking_info.get('status', 'Unknown')}",
+            f"🚚 *Courier:* {tracking_info['courier']}",
+        ]
+
+        # Add latest checkpoint if available
+        if tracking_info.get('checkpoints') and len(tracking_info['checkpoints']) > 0:
+            latest = tracking_info['checkpoints'][0]
+            message_lines.append("")
+            message_lines.append("*Latest Update:*")
+            message_lines.append(f"📅 {latest.get('date', 'N/A')} {latest.get('time', '')}")
+            if latest.get('activity'):
+                message_lines.append(f"📝 {latest['activity']}")
+            if latest.get('location'):
+                message_lines.append(f"📍 {latest['location']}")
+
+        # Add tracking URL
+        message_lines.append("")
+        message_lines.append(f"🔗 <{tracking_info['url']}|View Full Tracking>")
+
+        return "\n".join(message_lines)
+
     def send_to_google_chat(self, tracking_info, webhook_url):
         """
         Send tracking notification to Google Chat webhook
@@ -276,67 +1038,80 @@ class AnjaniTracker:
             bool: True if successful, False otherwise
         """
         try:
-            # Build the message text
-            status_emoji = {
-                'DELIVERED': '✅',
-                'IN TRANSIT': '🚛',
-                'PENDING': '⏳',
-                'OUT FOR DELIVERY': '🚚'
-            }
+            text = self.format_message(tracking_info)
+        except Exception as e:
+            print(f"❌ Unexpected error sending to Google Chat: {str(e)}")
+            return False
 
-            emoji = status_emoji.get(tracking_info.get('status', ''), '📍')
-
-            # Build title with optional label
-            title = f"📦 Package Update - {tracking_info['tracking_number']}"
-            if tracking_info.get('label'):
-                title = f"📦 {tracking_info['label']} ({tracking_info['tracking_number']})"
-
-            message_lines = [
-                f"*{title}*",
-                f"{emoji} *Status:* {tracking_info.get('status', 'Unknown')}",
-                f"🚚 *Courier:* {tracking_info['courier']}",
-            ]
-
-            # Add latest checkpoint if available
-            if tracking_info.get('checkpoints') and len(tracking_info['checkpoints']) > 0:
-                latest = tracking_info['checkpoints'][0]
-                message_lines.append("")
-                message_lines.append("*Latest Update:*")
-                message_lines.append(f"📅 {latest.get('date', 'N/A')} {latest.get('time', '')}")
-                if latest.get('activity'):
-                    message_lines.append(f"📝 {latest['activity']}")
-                if latest.get('location'):
-                    message_lines.append(f"📍 {latest['location']}")
-
-            # Add tracking URL
-            message_lines.append("")
-            message_lines.append(f"🔗 <{tracking_info['url']}|View Full Tracking>")
+        if self._post_to_google_chat(text, webhook_url):
+            print(f"💬 Sent notification to Google Chat")
+            return True
+        return False
 
-            # Create Google Chat message payload
-            payload = {
-                "text": "\n".join(message_lines)
-            }
+    def send_batch_to_google_chat(self, messages, webhook_url, max_messages_per_post=10):
+        """
+        Send several notifications as few Google Chat messages as possible
 
-            # Send POST request to webhook
-            response = requests.post(
-                webhook_url,
-                json=payload,
-                headers={'Content-Type': 'application/json; charset=UTF-8'},
-                timeout=10
-            )
+        Args:
+            messages: Message texts, e.g. from format_message()
+            webhook_url: Google Chat webhook URL
+            max_messages_per_post: Messages combined into one post at most
+                (default: 10), keeping each post well under Chat's size limit
+
+        Returns:
+            int: Number of messages that were delivered
+        """
+        delivered = 0
+        for start in range(0, len(messages), max_messages_per_post):
+            chunk = messages[start:start + max_messages_per_post]
+            if self._post_to_google_chat("\n\n───────────\n\n".join(chunk), webhook_url):
+                delivered += len(chunk)
+
+        if delivered:
+            print(f"💬 Sent {delivered} notification(s) to Google Chat")
+        return delivered
+
+    def _post_to_google_chat(self, text, webhook_url):
+        """
+        POST a text message to a Google Chat webhook
+
+        429/5xx responses are retried with exponential backoff. Network
+        errors are not: the message may already have been posted, and
+        connect failures are retried by the session's adapter.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        # Create Google Chat message payload
+        payload = {
+            "text": text
+        }
+
+        for attempt in range(_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+            try:
+                # Send POST request to webhook
+                response = self.session.post(
+                    webhook_url,
+                    json=payload,
+                    headers={'Content-Type': 'application/json; charset=UTF-8'},
+                    timeout=10
+                )
+            except requests.exceptions.RequestException as e:
+                print(f"❌ Error sending to Google Chat: {str(e)}")
+                return False
+            except Exception as e:
+                print(f"❌ Unexpected error sending to Google Chat: {str(e)}")
+                return False
 
             if response.status_code == 200:
-                print(f"💬 Sent notification to Google Chat")
                 return True
-            else:
-                print(f"❌ Failed to send to Google Chat: {response.status_code} - {response.text}")
-                return False
+            if response.status_code in _CHAT_RETRY_STATUSES and attempt < _MAX_ATTEMPTS - 1:
+                continue
 
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error sending to Google Chat: {str(e)}")
-            return False
-        except Exception as e:
-            print(f"❌ Unexpected error sending to Google Chat: {str(e)}")
+            print(f"❌ Failed to send to Google Chat: {response.status_code} - {response.text}")
             return False
 
     @staticmethod
@@ -351,8 +1126,9 @@ class AnjaniTracker:
             dict: Dictionary with tracking IDs as keys and tracking info as values
         """
         try:
-            with open(state_file, 'r') as f:
-                return json.load(f)
+            with open(state_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         except FileNotFoundError:
             return {}
         except json.JSONDecodeError:
@@ -364,12 +1140,55 @@ class AnjaniTracker:
         """
         Save tracking state to JSON file
 
+        The file is left untouched if it already holds exactly this state.
+
         Args:
             state: Dictionary with tracking IDs as keys
             state_file: Path to state file (default: tracking_state.json)
+
+        Returns:
+            bool: True if the file was written, False if it was unchanged
+        """
+        if orjson is not None:
+            data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(state, indent=2).encode('utf-8')
+
+        try:
+            with open(state_file, 'rb') as f:
+                if f.read() == data:
+                    return False
+        except FileNotFoundError:
+            pass
+
+        # Write to a temp file and rename it over the old one, so an
+        # interrupted run can never leave a truncated state file behind
+        tmp_file = f"{state_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, state_file)
+        return True
+
+    @staticmethod
+    def content_hash(tracking_info):
+        """
+        Fingerprint the status and checkpoints of a tracking info dictionary
+
+        Two results with the same hash have identical status and checkpoints,
+        so comparing hashes is enough to rule out changes.
+
+        Args:
+            tracking_info: Tracking information
+
+        Returns:
+            str: 32-character hex digest
         """
-        with open(state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        content = [tracking_info.get('status'), tracking_info.get('checkpoints', [])]
+        if orjson is not None:
+            data = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+        else:
+            data = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
 
     @staticmethod
     def has_changes(old_info, new_info):
@@ -391,26 +1210,24 @@ class AnjaniTracker:
         if old_status != new_status:
             changes.append(f"Status changed: {old_status} → {new_status}")
 
-        # Check if new checkpoints were added
-        old_checkpoints = old_info.get('checkpoints', [])
-        new_checkpoints = new_info.get('checkpoints', [])
-
-        # Compare number of checkpoints
-        if len(new_checkpoints) > len(old_checkpoints):
-            num_new = len(new_checkpoints) - len(old_checkpoints)
-            changes.append(f"{num_new} new checkpoint(s) added")
-
-        # Compare latest checkpoint details (if both have checkpoints)
-        if old_checkpoints and new_checkpoints:
-            old_latest = old_checkpoints[0]
-            new_latest = new_checkpoints[0]
-
-            # Check if the latest checkpoint is different
-            if (old_latest.get('date') != new_latest.get('date') or
-                old_latest.get('time') != new_latest.get('time') or
-                old_latest.get('activity') != new_latest.get('activity') or
-                old_latest.get('location') != new_latest.get('location')):
-                changes.append("Latest checkpoint updated")
+        # Diff checkpoints as sets of fingerprints, so entries inserted
+        # anywhere in the list are caught, not just a new latest one
+        old_checkpoints = old_info.get('checkpoints') or []
+        new_checkpoints = new_info.get('checkpoints') or []
+        old_keys = {_checkpoint_key(cp) for cp in old_checkpoints}
+        new_keys = [_checkpoint_key(cp) for cp in new_checkpoints]
+
+        added = [key for key in new_keys if key not in old_keys]
+        if added:
+            changes.append(f"{len(added)} new checkpoint(s) added")
+            for key in added[:3]:
+                changes.append("New: " + " ".join(part for part in key if part))
+
+        # Rows dropping out of the history aren't worth an alert on their
+        # own; they are only mentioned alongside a real update
+        removed = len(old_keys.difference(new_keys))
+        if removed and changes:
+            changes.append(f"{removed} checkpoint(s) no longer listed")
 
         # If we previously had no checkpoints but now we do
         if not old_checkpoints and new_checkpoints:
@@ -461,12 +1278,12 @@ def main():
         print("❌ Error: No tracking numbers provided")
         sys.exit(1)
 
-    tracker = AnjaniTracker(headless=not show_browser)
-
     print(f"\n🔍 Tracking {len(tracking_numbers)} package(s)...\n")
 
-    for tracking_number in tracking_numbers:
-        tracking_info = tracker.track(tracking_number)
+    tracker = AnjaniTracker(headless=not show_browser)
+
+    # All numbers are fetched concurrently in one browser, then reported in order
+    for tracking_info in tracker.track_multiple(tracking_numbers):
         tracker.print_tracking_info(tracking_info)
 
         if save_json and not tracking_info.get('error'):